@@ -21,9 +21,34 @@ from __future__ import annotations
 
 import os
 
+from typing import TYPE_CHECKING
+
 import click
 
 from ..logging import setup_logger
+from ..state import state
+
+if TYPE_CHECKING:
+    from typing import Any, Optional
+
+
+class PluginChoice(click.ParamType):
+    """
+    Click parameter type for selecting one of the loaded Buildarr plugins.
+
+    The list of valid choices is read from the global state when the value is converted,
+    as plugins are loaded after the CLI commands are defined.
+    """
+
+    name = "plugin"
+
+    def convert(
+        self,
+        value: Any,
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> str:
+        return click.Choice(sorted(state.plugins.keys())).convert(value, param, ctx)
 
 
 @click.group(
@@ -35,7 +35,7 @@ from ..logging import get_log_level
 from ..manager import load_managers
 from ..state import state
 from ..util import get_resolved_path, windows_to_posix
-from . import cli
+from . import PluginChoice, cli
 from .exceptions import (
     ComposeInvalidHostnameError,
     ComposeInvalidVolumeDefinitionError,
@@ -82,7 +82,7 @@ logger = getLogger(__name__)
     "--plugin",
     "use_plugins",
     metavar="PLUGIN",
-    type=str,
+    type=PluginChoice(),
     callback=lambda ctx, params, plugins: set(plugins),
     multiple=True,
     help=(
@@ -135,11 +135,7 @@ def compose(
     """
 
     logger.debug("Buildarr version %s (log level: %s)", __version__, get_log_level())
-    plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
-    logger.debug(
-        "Loaded plugins: %s",
-        ", ".join(plugin_strs) if plugin_strs else "(no plugins found)",
-    )
+    logger.debug("Loaded plugins: %s", state._plugins_str)
     logger.debug(
         "Creating Docker Compose file from configuration file: %s",
         str(config_path),
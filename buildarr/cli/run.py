@@ -39,7 +39,7 @@ from ..secrets import SecretsPlugin
 from ..state import state
 from ..trash import cleanup_trash_metadata, fetch_trash_metadata, trash_metadata_used
 from ..util import get_resolved_path
-from . import cli
+from . import PluginChoice, cli
 from .exceptions import RunInstanceConnectionTestFailedError, RunNoPluginsDefinedError
 
 logger = getLogger(__name__)
@@ -70,7 +70,7 @@ logger = getLogger(__name__)
     "--plugin",
     "use_plugins",
     metavar="PLUGIN",
-    type=str,
+    type=PluginChoice(),
     callback=lambda ctx, params, plugins: set(plugins),
     multiple=True,
     help=(
@@ -120,11 +120,7 @@ def _run(use_plugins: Optional[Set[str]] = None) -> None:
         logger.debug(indent(config_line, "  "))
 
     # Output the currently loaded plugins to the logs.
-    plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
-    logger.info(
-        "Loaded plugins: %s",
-        ", ".join(plugin_strs) if plugin_strs else "(no plugins found)",
-    )
+    logger.info("Loaded plugins: %s", state._plugins_str)
 
     # Load the manager object for each plugin into global state.
     logger.debug("Loading plugin managers")
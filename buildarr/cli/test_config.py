@@ -18,16 +18,17 @@
 
 from __future__ import annotations
 
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
-from textwrap import indent
 from typing import TYPE_CHECKING
 
 import click
 
 from .. import __version__
 from ..config import (
+    get_config_cache_path,
     load_config,
+    load_config_from_json,
     load_instance_configs,
     render_instance_configs,
     resolve_instance_dependencies,
@@ -37,11 +38,11 @@ from ..manager import load_managers
 from ..state import state
 from ..trash import cleanup_trash_metadata, fetch_trash_metadata, trash_metadata_used
 from ..util import get_resolved_path
-from . import cli
+from . import PluginChoice, cli
 from .exceptions import TestConfigNoPluginsDefinedError
 
 if TYPE_CHECKING:
-    from typing import Set
+    from typing import FrozenSet
 
 
 logger = getLogger(__name__)
@@ -75,41 +76,47 @@ logger = getLogger(__name__)
     "--plugin",
     "use_plugins",
     metavar="PLUGIN",
-    type=str,
-    callback=lambda ctx, params, plugins: set(plugins),
+    type=PluginChoice(),
+    callback=lambda ctx, params, plugins: frozenset(plugins),
     multiple=True,
     help=(
         "Use only the specified Buildarr plugin. Default is to use all installed plugins. "
         "(can be defined multiple times)"
     ),
 )
-def test_config(config_path: Path, use_plugins: Set[str]) -> None:
+def test_config(config_path: Path, use_plugins: FrozenSet[str]) -> None:
     """
     `buildarr test-config` main routine.
 
     Args:
         config_path (Path): Configuration file to load.
-        use_plugins (Set[str]): Plugins to load. If empty, use all plugins.
+        use_plugins (FrozenSet[str]): Plugins to load. If empty, use all plugins.
     """
 
     logger.info("Buildarr version %s (log level: %s)", __version__, get_log_level())
-    plugin_strs = [f"{pn} ({state.plugins[pn].version})" for pn in sorted(state.plugins.keys())]
-    logger.info(
-        "Loaded plugins: %s",
-        ", ".join(plugin_strs) if plugin_strs else "(no plugins found)",
-    )
-    logger.info("Testing configuration file: %s", str(config_path))
+    logger.info("Loaded plugins: %s", state._plugins_str)
+    logger.info("Testing configuration file: %s", config_path)
 
     # Load and validate the Buildarr configuration.
+    # If the configuration files are unchanged since the last successful test,
+    # load the configuration from the cache file written by that test,
+    # instead of parsing the configuration files again.
+    config_cache_path = get_config_cache_path(config_path)
     try:
-        load_config(path=config_path, use_plugins=use_plugins)
+        if not load_config_from_json(
+            cache_path=config_cache_path,
+            path=config_path,
+            use_plugins=use_plugins,
+        ):
+            load_config(path=config_path, use_plugins=use_plugins, cache_path=config_cache_path)
     except Exception:
         logger.error("Loading configuration: FAILED")
         raise
     else:
-        logger.debug("Buildarr configuration:")
-        for config_line in state.config.model_dump_yaml(exclude_unset=True).splitlines():
-            logger.debug(indent(config_line, "  "))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Buildarr configuration:")
+            for config_line in state.config.model_dump_yaml_lines(exclude_unset=True):
+                logger.debug("  %s", config_line)
         logger.info("Loading configuration: PASSED")
 
     # Load the manager objects for the selected plugins.
@@ -119,9 +126,10 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.error("Loading plugin managers: FAILED")
         raise
     else:
-        logger.debug("Managers loaded for the following plugins:")
-        for plugin_name in state.managers.keys():
-            logger.debug("  - %s", plugin_name)
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Managers loaded for the following plugins:")
+            for plugin_name in state.managers.keys():
+                logger.debug("  - %s", plugin_name)
         logger.info("Loading plugin managers: PASSED")
 
     # Parse and validate the instance-specific configurations under each plugin.
@@ -131,14 +139,15 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.error("Loading instance configurations: FAILED")
         raise
     else:
-        for plugin_name, instance_configs in state.instance_configs.items():
-            for instance_name, instance_config in instance_configs.items():
-                with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                    logger.debug("Instance configuration:")
-                    for config_line in instance_config.model_dump_yaml(
-                        exclude_unset=True,
-                    ).splitlines():
-                        logger.debug(indent(config_line, "  "))
+        if logger.isEnabledFor(DEBUG):
+            for plugin_name, instance_configs in state.instance_configs.items():
+                for instance_name, instance_config in instance_configs.items():
+                    with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
+                        logger.debug("Instance configuration:")
+                        for config_line in instance_config.model_dump_yaml_lines(
+                            exclude_unset=True,
+                        ):
+                            logger.debug("  %s", config_line)
         logger.info("Loading instance configurations: PASSED")
 
     # Check if configuration was found for any selected plugins.
@@ -156,9 +165,10 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
         logger.error("Resolving instance dependencies: FAILED")
         raise
     else:
-        logger.debug("Execution order:")
-        for i, (plugin_name, instance_name) in enumerate(state._execution_order, 1):
-            logger.debug("  %i. %s.instances[%s]", i, plugin_name, repr(instance_name))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Execution order:")
+            for i, (plugin_name, instance_name) in enumerate(state._execution_order, 1):
+                logger.debug("  %i. %s.instances[%s]", i, plugin_name, repr(instance_name))
         logger.info("Resolving instance dependencies: PASSED")
 
     # Test fetching TRaSH-Guides metadata, if the configuration uses it.
@@ -201,16 +211,24 @@ def test_config(config_path: Path, use_plugins: Set[str]) -> None:
     else:
         logger.info("Cleaning up TRaSH-Guides metadata: SKIPPED (not required)")
 
-    # Log the pre-initialisation rendered configuration to debug output.
-    for plugin_name, instance_configs in state.instance_configs.items():
-        for instance_name, instance_config in instance_configs.items():
-            with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                if state.managers[plugin_name].uses_trash_metadata(instance_config):
+    # Log the pre-initialisation rendered configuration to debug output,
+    # for instances that were rendered using TRaSH-Guides metadata.
+    #
+    # Whether or not an instance uses TRaSH-Guides metadata is checked on the configuration
+    # before rendering, as that is what determines whether the metadata is available to it
+    # during rendering. Rendering only populates attributes from the metadata, and does not
+    # change the attributes the check depends on, so the result still applies afterwards.
+    if logger.isEnabledFor(DEBUG):
+        for plugin_name, instance_configs in state.instance_configs.items():
+            for instance_name, instance_config in instance_configs.items():
+                if not state._uses_trash_metadata[(plugin_name, instance_name)]:
+                    continue
+                with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
                     logger.debug("Rendered instance configuration:")
-                    for config_line in instance_config.model_dump_yaml(
+                    for config_line in instance_config.model_dump_yaml_lines(
                         exclude_unset=True,
-                    ).splitlines():
-                        logger.debug(indent(config_line, "  "))
+                    ):
+                        logger.debug("  %s", config_line)
 
     # If we get to this point, this configuration is pretty much guaranteed to be valid.
     # Incorrect values for a remote application instance notwithstanding, it should
@@ -20,7 +20,12 @@ from __future__ import annotations
 
 from .base import ConfigBase
 from .exceptions import ConfigError, ConfigTrashIDNotFoundError
-from .load import load_config, load_instance_configs
+from .load import (
+    get_config_cache_path,
+    load_config,
+    load_config_from_json,
+    load_instance_configs,
+)
 from .models import ConfigPlugin, ConfigPluginType, ConfigType
 from .post_init_render import post_init_render
 from .render_instance_configs import render_instance_configs
@@ -35,7 +40,9 @@ __all__ = [
     "ConfigType",
     "ConfigPluginType",
     "RemoteMapEntry",
+    "get_config_cache_path",
     "load_config",
+    "load_config_from_json",
     "load_instance_configs",
     "post_init_render",
     "resolve_instance_dependencies",
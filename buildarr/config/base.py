@@ -18,14 +18,17 @@ Buildarr configuration base class.
 
 from __future__ import annotations
 
+from io import StringIO
 from logging import getLogger
 from pathlib import PurePosixPath, PureWindowsPath
 from typing import (
+    IO,
     Any,
     Callable,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -33,6 +36,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
     get_args as get_type_args,
     get_origin as get_type_origin,
 )
@@ -51,6 +55,10 @@ logger = getLogger(__name__)
 
 OPTIONAL_TYPE_UNION_SIZE = 2
 
+# Use the LibYAML-based dumper when available, as it is much faster
+# than the pure Python implementation.
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ConfigBase(BaseModel, Generic[Secrets]):
     """
@@ -823,9 +831,60 @@ class ConfigBase(BaseModel, Generic[Secrets]):
         Returns:
             YAML representation of the model
         """
-        return yaml.safe_dump(  # type: ignore[call-overload]
+        return cast(str, self._dump_yaml(sort_keys=sort_keys, yaml_kwargs=yaml_kwargs, **kwargs))
+
+    def model_dump_yaml_lines(
+        self,
+        *,
+        sort_keys: bool = False,
+        yaml_kwargs: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Generate a YAML representation of the model, and iterate over it line by line.
+
+        This is useful for writing the YAML representation to logging output,
+        as it avoids creating a list containing every line.
+        The returned lines do not contain trailing newline characters.
+
+        Takes the same arguments as `ConfigBase.model_dump_yaml`.
+
+        Args:
+            sort_keys (bool, optional): Sort keys in the output YAML file. Defaults to `False`.
+            yaml_kwargs (Optional[Mapping[str, Any]], optional): YAML encoder keyword args.
+
+        Yields:
+            Line from the YAML representation of the model
+        """
+        with StringIO() as stream:
+            self._dump_yaml(stream, sort_keys=sort_keys, yaml_kwargs=yaml_kwargs, **kwargs)
+            stream.seek(0)
+            for line in stream:
+                yield line.rstrip("\n")
+
+    def _dump_yaml(
+        self,
+        stream: Optional[IO[str]] = None,
+        *,
+        sort_keys: bool,
+        yaml_kwargs: Optional[Mapping[str, Any]],
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        Generate a YAML representation of the model, and write it to the given stream.
+
+        Args:
+            stream (Optional[IO[str]], optional): Stream to write to. Defaults to `None`.
+            sort_keys (bool): Sort keys in the output YAML file.
+            yaml_kwargs (Optional[Mapping[str, Any]]): YAML encoder keyword args.
+
+        Returns:
+            YAML representation of the model if no stream was given, otherwise `None`
+        """
+        return yaml.dump(  # type: ignore[call-overload]
             self.model_dump(mode="json", **kwargs),
-            **{**(yaml_kwargs or {}), "sort_keys": sort_keys},
+            stream,
+            **{"Dumper": YAML_DUMPER, **(yaml_kwargs or {}), "sort_keys": sort_keys},
         )
 
     model_config = model_config_base
@@ -125,6 +125,10 @@ class BuildarrConfig(ConfigBase):
     )
     """
     URL to download the latest TRaSH-Guides metadata from.
+
+    If the server returns an `ETag` header with the metadata, the metadata is saved to
+    the Buildarr cache directory (`$XDG_CACHE_HOME/buildarr`, or `~/.cache/buildarr`),
+    and is only downloaded again once it has changed on the server.
     """
 
     trash_metadata_dir_prefix: Optional[Path] = Path("Guides-master")
@@ -18,8 +18,16 @@ Buildarr configuration loading function.
 
 from __future__ import annotations
 
+import json
+import os
+
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import blake2b
+from io import BytesIO, TextIOWrapper
 from logging import getLogger
 from pathlib import Path
+from tempfile import mkstemp
 from typing import (
     TYPE_CHECKING,
     Type,
@@ -33,6 +41,7 @@ import yaml
 
 from pydantic import create_model
 
+from .. import __version__
 from ..state import state
 from ..types import LocalPath
 from ..util import get_absolute_path, merge_dicts
@@ -41,7 +50,7 @@ from .buildarr import BuildarrConfig
 from .models import ConfigType
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional, Set, Tuple
+    from typing import AbstractSet, Any, Dict, List, Optional, Set, Tuple
 
     from .models import ConfigPlugin, ConfigPluginType
 
@@ -49,19 +58,148 @@ logger = getLogger(__name__)
 
 OPTIONAL_TYPE_UNION_SIZE = 2
 
+CONFIG_FILE_CACHE_SIZE = 100
+
+_config_file_cache: OrderedDict[str, Tuple[int, int, Any, bytes]] = OrderedDict()
+"""
+Parsed configuration file cache, keyed by resolved file path.
+
+Values are 4-tuples of the file modification time (in nanoseconds), the file size,
+the object parsed from the file, and the digest of the file contents that were parsed.
+"""
+
 
-def load_config(path: Path, use_plugins: Optional[Set[str]] = None) -> None:
+def load_config(
+    path: Path,
+    use_plugins: Optional[AbstractSet[str]] = None,
+    cache_path: Optional[Path] = None,
+) -> None:
     """
     Load a configuration file using the given plugins.
 
     Args:
-        use_plugins (Optional[Set[str]]): Plugins to use. Default is to use all plugins.
+        use_plugins (Optional[AbstractSet[str]]): Plugins to use. Default is to use all plugins.
         path (Union[str, PathLike]): Buildarr configuration file.
+        cache_path (Optional[Path]): Write a configuration cache file to this path,
+            for use with `load_config_from_json`. Default is to not write a cache file.
 
     Returns:
         2-tuple of the list of files loaded and the global configuration object
     """
 
+    model = _create_config_model(use_plugins)
+
+    logger.debug("Loading configuration file tree")
+    files, configs, digests = _get_files_and_configs(model, path)
+    logger.debug("Finished loading configuration file tree")
+
+    logger.debug("Merging configuration objects in order of file predecence:")
+    for file in files:
+        logger.debug("  - %s", file)
+    config = merge_dicts(*configs)
+    logger.debug("Finished merging configuration objects")
+
+    _validate_config(model=model, path=path, files=files, config=config)
+
+    if cache_path:
+        _write_config_cache(
+            cache_path=cache_path,
+            use_plugins=use_plugins,
+            files=files,
+            digests=digests,
+            config=config,
+        )
+
+
+load_config.cache_clear = _config_file_cache.clear  # type: ignore[attr-defined]
+
+
+def load_config_from_json(
+    cache_path: Path,
+    path: Path,
+    use_plugins: Optional[AbstractSet[str]] = None,
+) -> bool:
+    """
+    Load a configuration file from a configuration cache file written by `load_config`.
+
+    The cache file is only used if the contents of the configuration file,
+    and all files included from it, are unchanged since the cache file was written.
+    The Buildarr version, the installed plugins and their versions, and the selected plugins
+    must also be the same as when the cache file was written.
+
+    Args:
+        cache_path (Path): Configuration cache file.
+        path (Path): Buildarr configuration file the cache file was generated from.
+        use_plugins (Optional[AbstractSet[str]]): Plugins to use. Default is to use all plugins.
+
+    Returns:
+        `True` if the configuration was loaded from the cache file, otherwise `False`
+    """
+
+    logger.debug("Reading configuration cache file '%s'", cache_path)
+    try:
+        with cache_path.open(mode="r") as f:
+            header = json.loads(f.readline())
+            if not isinstance(header, dict):
+                raise ValueError(
+                    "Invalid header object type "
+                    f"(got '{type(header).__name__}', expected 'dict')",
+                )
+            environment = _get_config_cache_environment(use_plugins)
+            if {key: header.get(key) for key in environment.keys()} != environment:
+                logger.debug(
+                    (
+                        "Configuration cache file was written with a different Buildarr version, "
+                        "plugins or plugin selection"
+                    ),
+                )
+                return False
+            files = [Path(file) for file in header["files"]]
+            if not files or files[0] != path:
+                logger.debug("Configuration cache file is for a different configuration file")
+                return False
+            if header["content_version"] != _get_content_version(
+                [_get_file_digest(file.read_bytes()) for file in files],
+            ):
+                logger.debug("Configuration cache file is out of date")
+                return False
+            config = json.loads(f.read())
+            if not isinstance(config, dict):
+                raise ValueError(
+                    "Invalid configuration object type "
+                    f"(got '{type(config).__name__}', expected 'dict')",
+                )
+    except (OSError, KeyError, TypeError, ValueError) as err:
+        logger.debug("Unable to read configuration cache file: %s", err)
+        return False
+    logger.debug("Finished reading configuration cache file")
+
+    _validate_config(
+        model=_create_config_model(use_plugins),
+        path=path,
+        files=files,
+        config=config,
+    )
+
+    return True
+
+
+def get_config_cache_path(path: Path) -> Path:
+    """
+    Return the path of the configuration cache file for the given configuration file.
+
+    Args:
+        path (Path): Buildarr configuration file.
+
+    Returns:
+        Configuration cache file path
+    """
+
+    return path.with_name(f"{path.name}.cache.json")
+
+
+def _create_config_model(use_plugins: Optional[AbstractSet[str]] = None) -> Type[ConfigType]:
+    # Create the global configuration model for the given plugins.
     logger.debug("Building configuration model")
     model = cast(
         Type[ConfigType],
@@ -77,17 +215,26 @@ def load_config(path: Path, use_plugins: Optional[Set[str]] = None) -> None:
         ),
     )
     logger.debug("Finished building configuration model")
+    return model
 
-    logger.debug("Loading configuration file tree")
-    files, configs = _get_files_and_configs(model, path)
-    logger.debug("Finished loading configuration file tree")
-
-    logger.debug("Merging configuration objects in order of file predecence:")
-    for file in files:
-        logger.debug("  - %s", file)
-    config = merge_dicts(*configs)
-    logger.debug("Finished merging configuration objects")
 
+def _validate_config(
+    model: Type[ConfigType],
+    path: Path,
+    files: List[Path],
+    config: Dict[str, Any],
+) -> None:
+    # Parse and validate the merged configuration dictionary,
+    # and load the result into global state.
+    #
+    # Validation is still performed on configurations loaded from a cache file,
+    # as the model classes rely on validators to create the correct value types
+    # (e.g. enumerations, secrets and local paths), and to check instance references
+    # against the installed plugins.
+    #
+    # Pydantic's JSON validation mode is not used for cached configurations either,
+    # as it rejects default values defined as Python objects (e.g. `Path`)
+    # when `validate_default` is enabled.
     logger.debug("Parsing and validating configuration")
     with state._with_current_dir(path.parent):
         state.config = model(**config)
@@ -96,18 +243,111 @@ def load_config(path: Path, use_plugins: Optional[Set[str]] = None) -> None:
     state.config_files = files
 
 
+def _write_config_cache(
+    cache_path: Path,
+    use_plugins: Optional[AbstractSet[str]],
+    files: List[Path],
+    digests: List[bytes],
+    config: Dict[str, Any],
+) -> None:
+    # Write the merged configuration dictionary to a cache file,
+    # along with a header containing the list of loaded files, a hash of their contents,
+    # and the versions and selection of plugins used to load them.
+    #
+    # The configuration dictionary is stored before validation, so that loading
+    # the cache file produces exactly the same result as loading the configuration files.
+    # If the configuration contains values that cannot be stored in JSON without
+    # changing them (e.g. timestamps or non-string keys), the cache file is not written.
+    #
+    # The hash is generated from the same file contents that were parsed, so that
+    # files modified while loading the configuration invalidate the cache file.
+    #
+    # The configuration may contain secrets, so the cache file is only made readable
+    # by the current user. It is written to a temporary file first, and then moved
+    # into place, so that other processes never read a partially written cache file.
+    #
+    # The cache file is optional, so failing to write it is not an error.
+    logger.debug("Writing configuration cache file '%s'", cache_path)
+    try:
+        data = json.dumps(config)
+    except (TypeError, ValueError) as err:
+        logger.debug("Unable to write configuration cache file: %s", err)
+        return
+    if json.loads(data) != config:
+        logger.debug(
+            "Unable to write configuration cache file: %s",
+            "Configuration cannot be stored in JSON format",
+        )
+        return
+    header = json.dumps(
+        {
+            **_get_config_cache_environment(use_plugins),
+            "content_version": _get_content_version(digests),
+            "files": [os.fspath(file) for file in files],
+        },
+    )
+    temp_path: Optional[Path] = None
+    try:
+        fd, temp_file = mkstemp(
+            prefix=f".{cache_path.name}.",
+            suffix=".tmp",
+            dir=cache_path.parent,
+        )
+        temp_path = Path(temp_file)
+        with os.fdopen(fd, mode="w") as f:
+            f.write(f"{header}\n{data}")
+        temp_path.replace(cache_path)
+    except OSError as err:
+        logger.debug("Unable to write configuration cache file: %s", err)
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
+        return
+    logger.debug("Finished writing configuration cache file")
+
+
+def _get_config_cache_environment(use_plugins: Optional[AbstractSet[str]]) -> Dict[str, Any]:
+    # Return the configuration cache file header values that describe the environment
+    # the configuration was loaded in.
+    #
+    # Sections for plugins that are not installed or not selected are removed
+    # from the configuration while loading it, so a cache file can only be used
+    # with the same plugins that it was written with.
+    return {
+        "buildarr_version": __version__,
+        "plugins": {
+            plugin_name: state.plugins[plugin_name].version
+            for plugin_name in sorted(state.plugins.keys())
+        },
+        "use_plugins": sorted(use_plugins) if use_plugins else [],
+    }
+
+
+def _get_file_digest(content: bytes) -> bytes:
+    # Generate a hash of the contents of a file.
+    return blake2b(content).digest()
+
+
+def _get_content_version(digests: List[bytes]) -> str:
+    # Generate a combined hash from the content hashes of the given files, in order.
+    content_hash = blake2b()
+    for digest in digests:
+        content_hash.update(digest)
+    return content_hash.hexdigest()
+
+
 def _get_files_and_configs(
     model: Type[ConfigType],
     path: Path,
-) -> Tuple[List[Path], List[Dict[str, ConfigPlugin]]]:
+) -> Tuple[List[Path], List[Dict[str, ConfigPlugin]], List[bytes]]:
     # Load a configuration file.
     # If other files are included using the `includes` list structure,
-    # load them as well, and return a 2-tuple of
-    # the lists of file paths and configuration dictionaries,
+    # load them as well, and return a 3-tuple of
+    # the lists of file paths, configuration dictionaries and file content hashes,
     # in the order they were loaded.
 
     files = [path]
     configs: List[Dict[str, Any]] = []
+    digests: List[bytes] = []
 
     # First, read the YAML configuration file into an object.
     #
@@ -120,23 +360,24 @@ def _get_files_and_configs(
     # relative to the actual configuration file the value was loaded from.
     #
     # Once processing is done, add it to the list of configuration dictionaries to merge.
-    with path.open(mode="r") as f:
-        config: Optional[Dict[str, Any]] = yaml.safe_load(f)
-        if config is None:
-            config = {}
-        if not isinstance(config, dict):
-            raise ValueError(
-                f"Error while loading configuration file '{path}': "
-                "Invalid configuration object type "
-                f"(got '{type(config).__name__}', expected 'dict'): {config}",
-            )
-        configs.append(
-            _expand_relative_paths(
-                config_dir=path.parent,
-                value_type=model,
-                value={k: v for k, v in config.items() if k != "includes"},
-            ),
+    config: Optional[Dict[str, Any]]
+    config, digest = _load_config_file(path)
+    digests.append(digest)
+    if config is None:
+        config = {}
+    if not isinstance(config, dict):
+        raise ValueError(
+            f"Error while loading configuration file '{path}': "
+            "Invalid configuration object type "
+            f"(got '{type(config).__name__}', expected 'dict'): {config}",
         )
+    configs.append(
+        _expand_relative_paths(
+            config_dir=path.parent,
+            value_type=model,
+            value={k: v for k, v in config.items() if k != "includes"},
+        ),
+    )
 
     # If other files were included using the `includes` list structure,
     # recursively load them and add them to the list of files and objects.
@@ -156,11 +397,43 @@ def _get_files_and_configs(
             else:
                 include_path = get_absolute_path(path.parent / ip)
                 logger.debug("Expanding relative local path '%s' into '%s'", ip, include_path)
-            _files, _configs = _get_files_and_configs(model, include_path)
+            _files, _configs, _digests = _get_files_and_configs(model, include_path)
             files.extend(_files)
             configs.extend(_configs)
+            digests.extend(_digests)
+
+    return (files, configs, digests)
+
 
-    return (files, configs)
+def _load_config_file(path: Path) -> Tuple[Any, bytes]:
+    # Parse a YAML configuration file, and return a 2-tuple of the resulting object
+    # and the hash of the file contents that were parsed.
+    #
+    # The parsed object is cached using the resolved path of the file as the key,
+    # and reused for as long as the modification time and size of the file are unchanged.
+    # This avoids re-parsing files that have not changed when the configuration
+    # gets reloaded within the same process (e.g. in daemon mode).
+    #
+    # The cached object is deep copied before being returned, so that
+    # any modifications made by the caller do not affect the cache.
+    cache_key = os.fspath(path.resolve())
+    stat = path.stat()
+    cached = _config_file_cache.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _config_file_cache.move_to_end(cache_key)
+        return (deepcopy(cached[2]), cached[3])
+    content = path.read_bytes()
+    # Parse the file contents from a stream named after the file,
+    # so that parser errors reference the file the same way as when reading it directly.
+    buffer = BytesIO(content)
+    buffer.name = os.fspath(path)
+    config = yaml.safe_load(TextIOWrapper(buffer))
+    digest = _get_file_digest(content)
+    _config_file_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, config, digest)
+    _config_file_cache.move_to_end(cache_key)
+    while len(_config_file_cache) > CONFIG_FILE_CACHE_SIZE:
+        _config_file_cache.popitem(last=False)
+    return (deepcopy(config), digest)
 
 
 def _expand_relative_paths(
@@ -266,7 +539,7 @@ def _is_subclass(type_obj: Type[Any], classes: Union[Type[Any], Tuple[Type[Any]]
         return False
 
 
-def load_instance_configs(use_plugins: Optional[Set[str]] = None) -> None:
+def load_instance_configs(use_plugins: Optional[AbstractSet[str]] = None) -> None:
     """
     Parse fully-qualified configuration for each instance under each selected plugin.
 
@@ -275,7 +548,7 @@ def load_instance_configs(use_plugins: Optional[Set[str]] = None) -> None:
     in each instance-specific configuration.
 
     Args:
-        use_plugins (Optional[Set[str]]): Plugins to use. Default is to use all plugins.
+        use_plugins (Optional[AbstractSet[str]]): Plugins to use. Default is to use all plugins.
     """
 
     configs: Dict[str, Dict[str, ConfigPlugin]] = {}
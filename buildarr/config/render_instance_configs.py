@@ -44,6 +44,10 @@ def render_instance_configs() -> None:
 
     instance_configs: DefaultDict[str, Dict[str, ConfigPlugin]] = defaultdict(dict)
 
+    # NOTE: Instances are deliberately rendered one at a time, in execution order.
+    # Plugin render functions are synchronous, and the current plugin/instance context
+    # used for logging and instance references is stored in global state,
+    # so rendering instances concurrently would mix up the context between them.
     for plugin_name, instance_name in state._execution_order:
         manager = state.managers[plugin_name]
         instance_config = state.instance_configs[plugin_name][instance_name]
@@ -25,7 +25,7 @@ from ..plugins import Config, Secrets
 from ..state import state
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Set
+    from typing import AbstractSet, Any, Dict, Optional
 
 
 logger = getLogger(__name__)
@@ -247,12 +247,12 @@ class ManagerPlugin(Generic[Config, Secrets]):
         )
 
 
-def load_managers(use_plugins: Optional[Set[str]] = None) -> None:
+def load_managers(use_plugins: Optional[AbstractSet[str]] = None) -> None:
     """
     Load the managers for each plugin to be used in this Buildarr run.
 
     Args:
-        use_plugins (Optional[Set[str]]): Plugins to use. Default is to use all plugins.
+        use_plugins (Optional[AbstractSet[str]]): Plugins to use. Default is to use all plugins.
     """
 
     managers: Dict[str, ManagerPlugin] = {}
@@ -59,6 +59,11 @@ def load(namespace: str = "buildarr.plugins") -> None:
             plugins[plugin.name] = plugin.entry_point.load()
 
     state.plugins = plugins
+    state._plugins_str = (
+        ", ".join(f"{pn} ({plugins[pn].version})" for pn in sorted(plugins.keys()))
+        if plugins
+        else "(no plugins found)"
+    )
 
 
 def _on_plugin_failure(manager: ExtensionManager, entry_point: EntryPoint, err: Exception) -> None:
@@ -127,6 +127,15 @@ class State:
     Secrets metadata for each instance, under each plugin.
     """
 
+    _plugins_str: str = "(no plugins found)"
+    """
+    Names and versions of the loaded Buildarr plugins, for output to the logs.
+
+    This is generated once when the plugins are loaded.
+
+    This state attribute is internal, and shouldn't be accessed by plugins.
+    """
+
     _current_dir: Path = Path.cwd()
     """
     Current working directory for relative path resolution.
@@ -171,6 +180,16 @@ class State:
     This state attribute is internal, and shouldn't be accessed by plugins.
     """
 
+    _uses_trash_metadata: Mapping[PluginInstanceRef, bool]
+    """
+    Whether or not each instance configuration uses TRaSH-Guides metadata.
+
+    This attribute is populated when checking whether or not TRaSH-Guides metadata
+    needs to be fetched, after the instance-specific configurations are loaded.
+
+    This state attribute is internal, and shouldn't be accessed by plugins.
+    """
+
     def __init__(self) -> None:
         self._reset()
 
@@ -192,6 +211,7 @@ class State:
         self._current_instance = None  # type: ignore[assignment]
         self._instance_dependencies = defaultdict(set)  # type: ignore[assignment]
         self._execution_order = None  # type: ignore[assignment]
+        self._uses_trash_metadata = None  # type: ignore[assignment]
 
     @contextmanager
     def _with_current_dir(self, current_dir: Path) -> Generator[None, None, None]:
@@ -18,77 +18,150 @@ Buildarr TRaSH-Guides metadata functions.
 
 from __future__ import annotations
 
+import os
+import time
+
+from hashlib import blake2b
+from http import HTTPStatus
 from logging import getLogger
-from shutil import move, rmtree
-from urllib.request import urlretrieve
+from pathlib import Path, PurePosixPath
+from shutil import copyfileobj, copytree
+from tempfile import mkstemp
+from typing import TYPE_CHECKING
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 from zipfile import ZipFile
 
 from .state import state
-from .util import create_temp_dir, remove_dir
+from .util import create_temp_dir, get_cache_dir, remove_dir
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional
+
+    from .state import PluginInstanceRef
 
 logger = getLogger(__name__)
 
+TRASH_METADATA_CACHE_RETENTION = 24 * 60 * 60
+"""
+Time (in seconds) to keep out of date versions of cached TRaSH-Guides metadata,
+so that other Buildarr processes still using them can finish their runs.
+"""
+
 
 def trash_metadata_used() -> bool:
     """
     Read configuration for all loaded instances in the global state, and determine
     whether or not any of them use TRaSH-Guides metadata.
 
+    The result for each individual instance is saved to `state._uses_trash_metadata`,
+    so it can be reused later in the run without checking the configuration again.
+
     Returns:
         `True` if TRaSH-Guides metadata is used by any instance configuration, otherwise `False`
     """
 
+    uses_trash_metadata: Dict[PluginInstanceRef, bool] = {}
+
     for plugin_name in state.active_plugins:
+        manager = state.managers[plugin_name]
         for instance_name, instance_config in state.instance_configs[plugin_name].items():
             with state._with_context(plugin_name=plugin_name, instance_name=instance_name):
-                if state.managers[plugin_name].uses_trash_metadata(instance_config):
-                    return True
+                uses_trash_metadata[(plugin_name, instance_name)] = manager.uses_trash_metadata(
+                    instance_config,
+                )
+
+    state._uses_trash_metadata = uses_trash_metadata
 
-    return False
+    return any(uses_trash_metadata.values())
 
 
 def fetch_trash_metadata() -> None:
     """
-    Download the TRaSH-Guides metadata from the URL specified in the Buildarr config
+    Download the TRaSH-Guides metadata from the URL specified in the Buildarr config,
+    and extract it to a local directory.
+
+    If the server returns an `ETag` header for the metadata, the extracted metadata
+    is saved to the Buildarr cache directory. When fetching the metadata again,
+    if the server reports that it has not changed, the cached metadata is used
+    instead of downloading it again. Otherwise, the metadata is extracted
     to a temporary directory.
 
-    The temporary path gets added to the Buildarr global state, in addition to
-    being yielded to the caller.
+    The metadata directory path gets added to the Buildarr global state.
     """
 
-    try:
-        logger.debug("Creating TRaSH metadata download temporary directory")
-        temp_dir = create_temp_dir()
-        logger.debug("Finished creating TRaSH metadata download temporary directory")
+    trash_metadata_download_url = str(state.config.buildarr.trash_metadata_download_url)
+    cache_dir = _get_trash_metadata_cache_dir(trash_metadata_download_url)
+    cached_etag = _get_cached_trash_metadata_etag(cache_dir)
 
-        trash_metadata_filename = temp_dir / "trash-metadata.zip"
+    temp_dir: Optional[Path] = None
 
+    try:
         logger.debug("Downloading TRaSH metadata")
-        urlretrieve(  # noqa: S310
-            str(state.config.buildarr.trash_metadata_download_url),
-            trash_metadata_filename,
-        )
+        try:
+            response = urlopen(  # noqa: S310
+                Request(  # noqa: S310
+                    trash_metadata_download_url,
+                    headers={"If-None-Match": cached_etag} if cached_etag else {},
+                ),
+            )
+        except HTTPError as err:
+            err.close()
+            if cached_etag and err.code == HTTPStatus.NOT_MODIFIED:
+                logger.debug("TRaSH metadata is unchanged, using cached TRaSH metadata")
+                state.trash_metadata_dir = cache_dir / _get_cache_key(cached_etag)
+                return
+            raise
+        with response:
+            etag: Optional[str] = response.headers.get("ETag")
+
+            logger.debug("Creating TRaSH metadata download temporary directory")
+            temp_dir = create_temp_dir()
+            logger.debug("Finished creating TRaSH metadata download temporary directory")
+
+            trash_metadata_filename = temp_dir / "trash-metadata.zip"
+            with trash_metadata_filename.open("wb") as f:
+                copyfileobj(response, f)
         logger.debug("Finished downloading TRaSH metadata")
 
+        # Only extract the files located under the metadata directory prefix,
+        # directly into the target directory.
         logger.debug("Extracting TRaSH metadata")
+        prefix_parts = (
+            state.config.buildarr.trash_metadata_dir_prefix.parts
+            if state.config.buildarr.trash_metadata_dir_prefix
+            else ()
+        )
         with ZipFile(trash_metadata_filename) as zip_file:
-            zip_file.extractall(path=temp_dir / "__trash-metadata__")
+            found_prefix = not prefix_parts
+            for member in zip_file.infolist():
+                member_parts = PurePosixPath(member.filename).parts
+                if member_parts[: len(prefix_parts)] != prefix_parts:
+                    continue
+                found_prefix = True
+                if len(member_parts) == len(prefix_parts):
+                    continue
+                member.filename = "/".join(member_parts[len(prefix_parts) :]) + (
+                    "/" if member.is_dir() else ""
+                )
+                zip_file.extract(member, path=temp_dir)
         trash_metadata_filename.unlink()
+        if not found_prefix:
+            raise FileNotFoundError(
+                "Unable to find TRaSH metadata directory "
+                f"'{state.config.buildarr.trash_metadata_dir_prefix}' in downloaded ZIP file",
+            )
         logger.debug("Finished extracting TRaSH metadata")
 
-        logger.debug("Moving TRaSH metadata files to target directory")
-        trash_metadata_dir = temp_dir / "__trash-metadata__"
-        if state.config.buildarr.trash_metadata_dir_prefix:
-            trash_metadata_dir /= state.config.buildarr.trash_metadata_dir_prefix
-        for subfile in trash_metadata_dir.iterdir():
-            move(str(subfile), temp_dir)
-        rmtree(temp_dir / "__trash-metadata__")
-        logger.debug("Finished moving TRaSH metadata files to target directory")
-
-        state.trash_metadata_dir = temp_dir
+        state.trash_metadata_dir = (
+            _cache_trash_metadata(cache_dir=cache_dir, etag=etag, temp_dir=temp_dir)
+            if etag
+            else temp_dir
+        )
 
     except Exception:
-        cleanup_trash_metadata()
+        if temp_dir:
+            remove_dir(temp_dir)
         raise
 
 
@@ -96,8 +169,120 @@ def cleanup_trash_metadata() -> None:
     """
     Remove the TRaSH-Guides metadata temporary directory after use,
     and remove it from Buildarr global state.
+
+    Metadata saved to the Buildarr cache directory is left in place,
+    so it can be reused in later runs.
     """
 
-    if state.trash_metadata_dir:
+    if state.trash_metadata_dir and _get_trash_metadata_cache_root() not in (
+        state.trash_metadata_dir.parents
+    ):
         remove_dir(state.trash_metadata_dir)
     state.trash_metadata_dir = None  # type: ignore[assignment]
+
+
+def _get_trash_metadata_cache_root() -> Path:
+    # Return the directory where cached TRaSH-Guides metadata is stored.
+    return get_cache_dir() / "trash-metadata"
+
+
+def _get_trash_metadata_cache_dir(trash_metadata_download_url: str) -> Path:
+    # Return the cache directory for TRaSH-Guides metadata downloaded from the given URL.
+    # The metadata directory prefix is also part of the key, as it changes
+    # which files get extracted.
+    return _get_trash_metadata_cache_root() / _get_cache_key(
+        f"{trash_metadata_download_url}\n{state.config.buildarr.trash_metadata_dir_prefix}",
+    )
+
+
+def _get_cached_trash_metadata_etag(cache_dir: Path) -> Optional[str]:
+    # Return the entity tag of the cached TRaSH-Guides metadata in the given cache directory,
+    # or `None` if there is no usable cached metadata.
+    try:
+        etag = (cache_dir / "etag").read_text()
+    except OSError:
+        return None
+    if not (cache_dir / _get_cache_key(etag)).is_dir():
+        return None
+    return etag
+
+
+def _cache_trash_metadata(cache_dir: Path, etag: str, temp_dir: Path) -> Path:
+    # Save the extracted TRaSH-Guides metadata to the cache directory,
+    # and return the new location of the metadata.
+    #
+    # Each version of the metadata is stored in a separate directory,
+    # named after its entity tag.
+    #
+    # The cache directory may be shared between multiple Buildarr processes
+    # (e.g. a daemon and an ad-hoc `test-config` run), so it is updated without
+    # changing or removing anything another process may still be using:
+    #
+    # * The metadata is copied to a uniquely named staging directory in the cache directory,
+    #   and then renamed to the version directory in one atomic operation.
+    #   If another process saved the same version first, that copy is used instead.
+    # * The entity tag file is replaced in one atomic operation.
+    # * Out of date versions are only removed once they have been out of date
+    #   for longer than `TRASH_METADATA_CACHE_RETENTION`.
+    #
+    # The cache is optional, so if the metadata cannot be saved to it,
+    # keep using the temporary directory.
+    metadata_dir = cache_dir / _get_cache_key(etag)
+    logger.debug("Saving TRaSH metadata to cache directory '%s'", metadata_dir)
+    staging_dir: Optional[Path] = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if not metadata_dir.is_dir():
+            staging_dir = create_temp_dir(prefix=".buildarr.", dir=cache_dir)
+            copytree(temp_dir, staging_dir / "metadata")
+            try:
+                (staging_dir / "metadata").rename(metadata_dir)
+            except OSError:
+                if not metadata_dir.is_dir():
+                    raise
+                logger.debug("TRaSH metadata was already saved to cache directory")
+    except OSError as err:
+        logger.debug("Unable to save TRaSH metadata to cache directory: %s", err)
+        return temp_dir
+    finally:
+        if staging_dir:
+            remove_dir(staging_dir)
+    remove_dir(temp_dir)
+    try:
+        previous_etag = _get_cached_trash_metadata_etag(cache_dir)
+        _write_cached_trash_metadata_etag(cache_dir, etag)
+        # Record the time the previous version went out of date.
+        if previous_etag and previous_etag != etag:
+            os.utime(cache_dir / _get_cache_key(previous_etag))
+        expiry_time = time.time() - TRASH_METADATA_CACHE_RETENTION
+        for subfile in cache_dir.iterdir():
+            if (
+                subfile.is_dir()
+                and subfile != metadata_dir
+                and subfile.stat().st_mtime < expiry_time
+            ):
+                remove_dir(subfile)
+    except OSError as err:
+        logger.debug("Unable to update TRaSH metadata cache directory: %s", err)
+    else:
+        logger.debug("Finished saving TRaSH metadata to cache directory")
+    return metadata_dir
+
+
+def _write_cached_trash_metadata_etag(cache_dir: Path, etag: str) -> None:
+    # Replace the entity tag file in the given cache directory,
+    # so that other processes never read a partially written file.
+    fd, temp_file = mkstemp(prefix=".etag.", dir=cache_dir)
+    temp_path = Path(temp_file)
+    try:
+        with os.fdopen(fd, mode="w") as f:
+            f.write(etag)
+        temp_path.replace(cache_dir / "etag")
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _get_cache_key(value: str) -> str:
+    # Generate a short key suitable for use as a file name from the given string.
+    return blake2b(value.encode(), digest_size=8).hexdigest()
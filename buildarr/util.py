@@ -113,6 +113,26 @@ def get_resolved_path(path: Union[str, os.PathLike]) -> Path:
     return Path(os.path.realpath(os.path.expanduser(path)))  # noqa: PTH111
 
 
+def get_cache_dir() -> Path:
+    """
+    Return the directory used by Buildarr to store cached files.
+
+    This is `$XDG_CACHE_HOME/buildarr` if the `$XDG_CACHE_HOME` environment variable
+    is set, otherwise `~/.cache/buildarr`.
+
+    The directory is not guaranteed to exist.
+
+    Returns:
+        Buildarr cache directory path
+    """
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+
+    return (
+        get_absolute_path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    ) / "buildarr"
+
+
 def merge_dicts(*dicts: Mapping[Any, Any]) -> Dict[Any, Any]:
     """
     Recursively merge the specificed mappings into one dictionary structure.
@@ -118,6 +118,23 @@ def test_plugin(opt, buildarr_yml_factory, buildarr_compose) -> None:
     ]
 
 
+@pytest.mark.parametrize("opt", ["-p", "--plugin"])
+def test_plugin_not_installed(opt, buildarr_yml_factory, buildarr_compose) -> None:
+    """
+    Check that an error is returned if `--plugin` is used to select
+    a plugin that is not installed.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "dummy"}})
+
+    result = buildarr_compose(buildarr_yml, opt, "dummy3")
+
+    assert result.returncode == 2  # noqa: PLR2004
+    assert result.stderr.splitlines()[-1] == (
+        "Error: Invalid value for '-p' / '--plugin': 'dummy3' is not one of 'dummy', 'dummy2'."
+    )
+
+
 @pytest.mark.parametrize("opt", ["-V", "--compose-version"])
 def test_compose_version(opt, buildarr_yml_factory, buildarr_compose) -> None:
     """
@@ -178,3 +178,20 @@ def test_plugin(
     assert (
         "[INFO] <dummy2> (default) Remote configuration successfully updated" not in result.stdout
     )
+
+
+@pytest.mark.parametrize("opt", ["-p", "--plugin"])
+def test_plugin_not_installed(opt, buildarr_yml_factory, buildarr_run) -> None:
+    """
+    Check that an error is returned if `--plugin` is used to select
+    a plugin that is not installed.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "localhost"}})
+
+    result = buildarr_run(buildarr_yml, opt, "dummy3")
+
+    assert result.returncode == 2  # noqa: PLR2004
+    assert result.stderr.splitlines()[-1] == (
+        "Error: Invalid value for '-p' / '--plugin': 'dummy3' is not one of 'dummy', 'dummy2'."
+    )
@@ -19,12 +19,18 @@ Configuration attribute functional tests for the `buildarr test-config` CLI comm
 from __future__ import annotations
 
 import json
+import os
+import stat
+import sys
 
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
+from uuid import uuid4
 from zipfile import ZipFile
 
+import pytest
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -83,6 +89,174 @@ def test_instance_value(instance_value, buildarr_yml_factory, buildarr_test_conf
     assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
 
 
+def test_config_cache(instance_value, buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that the configuration is loaded from the configuration cache file
+    when the configuration file is unchanged since the last test.
+    """
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "buildarr": {"update_times": ["03:00"]},
+            "dummy": {
+                "hostname": "localhost",
+                "port": 9999,
+                "settings": {"instance_value": instance_value},
+            },
+        },
+    )
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+    assert (buildarr_yml.parent / "buildarr.yml.cache.json").exists()
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished reading configuration cache file" in result.stderr
+    assert "[DEBUG] Loading configuration file tree" not in result.stderr
+    assert f"instance_value: {instance_value}" in result.stderr
+    assert "[INFO] Loading configuration: PASSED" in result.stdout
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+def test_config_cache_out_of_date(
+    instance_value,
+    buildarr_yml_factory,
+    buildarr_test_config,
+) -> None:
+    """
+    Check that the configuration cache file is not used when a file included
+    from the configuration file has changed since the last test.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"includes": ["dummy.yml"]})
+    buildarr_yml_factory({"dummy": {"hostname": "localhost"}}, file_name="dummy.yml")
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+
+    buildarr_yml_factory(
+        {"dummy": {"hostname": "localhost", "settings": {"instance_value": instance_value}}},
+        file_name="dummy.yml",
+    )
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Configuration cache file is out of date" in result.stderr
+    assert "[DEBUG] Loading configuration file tree" in result.stderr
+    assert f"instance_value: {instance_value}" in result.stderr
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+@pytest.mark.parametrize("cache_content", ["[]\n{}\n", "null\n", "invalid\n"])
+def test_config_cache_invalid(cache_content, buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that an invalid configuration cache file is ignored,
+    and the configuration is loaded from the configuration file instead.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "localhost"}})
+    (buildarr_yml.parent / "buildarr.yml.cache.json").write_text(cache_content)
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Loading configuration file tree" in result.stderr
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+def test_config_cache_invalid_config(buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that a configuration cache file with a valid header,
+    but an invalid configuration object, is ignored.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "localhost"}})
+    cache_path = buildarr_yml.parent / "buildarr.yml.cache.json"
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+
+    header = cache_path.read_text().splitlines()[0]
+    cache_path.write_text(f"{header}\n[]\n")
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Unable to read configuration cache file" in result.stderr
+    assert "[DEBUG] Loading configuration file tree" in result.stderr
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+def test_config_cache_plugins(
+    instance_value,
+    buildarr_yml_factory,
+    buildarr_test_config,
+) -> None:
+    """
+    Check that the configuration cache file is not used when it was written
+    with a different selection of plugins.
+    """
+
+    dummy2_instance_value = str(uuid4())
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "dummy": {"hostname": "localhost", "settings": {"instance_value": instance_value}},
+            "dummy2": {
+                "hostname": "localhost",
+                "settings": {"instance_value": dummy2_instance_value},
+            },
+        },
+    )
+
+    result = buildarr_test_config("--plugin", "dummy", buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+    assert dummy2_instance_value not in result.stderr
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert (
+        "[DEBUG] Configuration cache file was written with a different Buildarr version, "
+        "plugins or plugin selection"
+    ) in result.stderr
+    assert "[DEBUG] Loading configuration file tree" in result.stderr
+    assert f"instance_value: {instance_value}" in result.stderr
+    assert f"instance_value: {dummy2_instance_value}" in result.stderr
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Not supported on Windows")
+def test_config_cache_permissions(buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that the configuration cache file is only readable by the current user,
+    as it may contain secrets.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "localhost"}})
+    buildarr_yml.chmod(0o644)
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished writing configuration cache file" in result.stderr
+    assert stat.S_IMODE((buildarr_yml.parent / "buildarr.yml.cache.json").stat().st_mode) == (
+        stat.S_IRUSR | stat.S_IWUSR
+    )
+    assert list(buildarr_yml.parent.glob(".buildarr.yml.cache.json.*")) == []
+
+
 def test_instance_dependency_multiple(buildarr_yml_factory, buildarr_test_config) -> None:
     """
     Check that instance dependency resolution is working properly
@@ -452,6 +626,188 @@ def test_trash_metadata_dir_prefix_custom(
     assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
 
 
+def test_trash_metadata_cache(
+    tmp_path: Path,
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_test_config,
+) -> None:
+    """
+    Check that downloaded TRaSH-Guides metadata is saved to the cache directory
+    when the server returns an entity tag, and reused if the server reports
+    that the metadata has not changed.
+    """
+
+    trash_id = "387e6278d8e06083d813358762e00000"
+    trash_metadata_download_url = httpserver.url_for("/master.zip")
+    cache_dir = tmp_path / "cache"
+    etag = '"0123456789abcdef"'
+
+    with BytesIO() as f:
+        with ZipFile(f, mode="w") as g:
+            g.writestr(
+                "Guides-master/docs/json/sonarr/quality-size/anime.json",
+                json.dumps(
+                    {
+                        "trash_id": trash_id,
+                        "qualities": [{"quality": "Bluray-1080p", "min": 50.0}],
+                    },
+                ),
+            )
+        httpserver.expect_ordered_request("/master.zip", method="GET").respond_with_data(
+            f.getvalue(),
+            content_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="master.zip"', "ETag": etag},
+        )
+    httpserver.expect_ordered_request(
+        "/master.zip",
+        method="GET",
+        headers={"If-None-Match": etag},
+    ).respond_with_data(status=304, headers={"ETag": etag})
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "buildarr": {"trash_metadata_download_url": trash_metadata_download_url},
+            "dummy": {"settings": {"trash_id": trash_id}},
+        },
+    )
+
+    result = buildarr_test_config(buildarr_yml, XDG_CACHE_HOME=str(cache_dir))
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished saving TRaSH metadata to cache directory" in result.stderr
+    assert "trash_value: 50.0" in result.stderr
+    assert "[INFO] Cleaning up TRaSH-Guides metadata: PASSED" in result.stdout
+    assert list((cache_dir / "buildarr" / "trash-metadata").glob("*/*/docs/json/sonarr/*"))
+
+    result = buildarr_test_config(buildarr_yml, XDG_CACHE_HOME=str(cache_dir))
+
+    assert result.returncode == 0
+    assert "[DEBUG] TRaSH metadata is unchanged, using cached TRaSH metadata" in result.stderr
+    assert "trash_value: 50.0" in result.stderr
+    assert "[INFO] Fetching TRaSH-Guides metadata: PASSED" in result.stdout
+    assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+    httpserver.check_assertions()
+
+
+def test_trash_metadata_cache_update(
+    tmp_path: Path,
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_test_config,
+) -> None:
+    """
+    Check that when the TRaSH-Guides metadata changes, the new version is saved
+    to the cache directory, the previous version is kept for other processes
+    that may still be using it, and versions that have been out of date for a long time
+    are removed.
+    """
+
+    trash_id = "387e6278d8e06083d813358762e00000"
+    trash_metadata_download_url = httpserver.url_for("/master.zip")
+    cache_dir = tmp_path / "cache"
+    etags = ['"0123456789abcdef"', '"fedcba9876543210"']
+
+    for i, etag in enumerate(etags):
+        with BytesIO() as f:
+            with ZipFile(f, mode="w") as g:
+                g.writestr(
+                    "Guides-master/docs/json/sonarr/quality-size/anime.json",
+                    json.dumps(
+                        {
+                            "trash_id": trash_id,
+                            "qualities": [{"quality": "Bluray-1080p", "min": 50.0 + i}],
+                        },
+                    ),
+                )
+            httpserver.expect_ordered_request("/master.zip", method="GET").respond_with_data(
+                f.getvalue(),
+                content_type="application/zip",
+                headers={"Content-Disposition": 'attachment; filename="master.zip"', "ETag": etag},
+            )
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "buildarr": {"trash_metadata_download_url": trash_metadata_download_url},
+            "dummy": {"settings": {"trash_id": trash_id}},
+        },
+    )
+
+    result = buildarr_test_config(buildarr_yml, XDG_CACHE_HOME=str(cache_dir))
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished saving TRaSH metadata to cache directory" in result.stderr
+
+    (trash_metadata_cache_dir,) = (cache_dir / "buildarr" / "trash-metadata").iterdir()
+    (old_metadata_dir,) = (d for d in trash_metadata_cache_dir.iterdir() if d.is_dir())
+    expired_dir = trash_metadata_cache_dir / "expired"
+    expired_dir.mkdir()
+    for d in (old_metadata_dir, expired_dir):
+        os.utime(d, (0, 0))
+
+    result = buildarr_test_config(buildarr_yml, XDG_CACHE_HOME=str(cache_dir))
+
+    assert result.returncode == 0
+    assert "[DEBUG] Finished saving TRaSH metadata to cache directory" in result.stderr
+    assert "trash_value: 51.0" in result.stderr
+    assert (trash_metadata_cache_dir / "etag").read_text() == etags[1]
+    assert old_metadata_dir.is_dir()
+    assert not expired_dir.exists()
+    assert len([d for d in trash_metadata_cache_dir.iterdir() if d.is_dir()]) == 2  # noqa: PLR2004
+    httpserver.check_assertions()
+
+
+def test_trash_metadata_dir_prefix_not_found(
+    httpserver: HTTPServer,
+    buildarr_yml_factory,
+    buildarr_test_config,
+) -> None:
+    """
+    Check that an error is returned when the directory defined in the
+    `buildarr.trash_metadata_dir_prefix` configuration attribute
+    does not exist in the downloaded ZIP file.
+    """
+
+    trash_id = "387e6278d8e06083d813358762e00000"
+    trash_metadata_download_url = httpserver.url_for("/master.zip")
+
+    with BytesIO() as f:
+        with ZipFile(f, mode="w") as g:
+            g.writestr(
+                "Guides-master/docs/json/sonarr/quality-size/anime.json",
+                json.dumps(
+                    {
+                        "trash_id": trash_id,
+                        "qualities": [{"quality": "Bluray-1080p", "min": 50.0}],
+                    },
+                ),
+            )
+        httpserver.expect_ordered_request("/master.zip", method="GET").respond_with_data(
+            f.getvalue(),
+            content_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="master.zip"'},
+        )
+
+    buildarr_yml = buildarr_yml_factory(
+        {
+            "buildarr": {
+                "trash_metadata_download_url": trash_metadata_download_url,
+                "trash_metadata_dir_prefix": "custom-prefix",
+            },
+            "dummy": {"settings": {"trash_id": trash_id}},
+        },
+    )
+
+    result = buildarr_test_config(buildarr_yml)
+
+    assert result.returncode == 1
+    assert "[ERROR] Fetching TRaSH-Guides metadata: FAILED" in result.stderr
+    assert result.stderr.splitlines()[-1] == (
+        "FileNotFoundError: Unable to find TRaSH metadata directory 'custom-prefix' "
+        "in downloaded ZIP file"
+    )
+
+
 def test_trash_metadata_download_fail(
     httpserver: HTTPServer,
     buildarr_yml_factory,
@@ -73,3 +73,20 @@ def test_plugin(opt, instance_value, buildarr_yml_factory, buildarr_test_config)
     assert "[INFO] Pre-initialisation configuration render: PASSED" in result.stdout
     assert "[INFO] Cleaning up TRaSH-Guides metadata: SKIPPED (not required)" in result.stdout
     assert result.stdout.splitlines()[-1].endswith("[INFO] Configuration test successful.")
+
+
+@pytest.mark.parametrize("opt", ["-p", "--plugin"])
+def test_plugin_not_installed(opt, buildarr_yml_factory, buildarr_test_config) -> None:
+    """
+    Check that an error is returned if `--plugin` is used to select
+    a plugin that is not installed.
+    """
+
+    buildarr_yml = buildarr_yml_factory({"dummy": {"hostname": "dummy"}})
+
+    result = buildarr_test_config(buildarr_yml, opt, "dummy3")
+
+    assert result.returncode == 2  # noqa: PLR2004
+    assert result.stderr.splitlines()[-1] == (
+        "Error: Invalid value for '-p' / '--plugin': 'dummy3' is not one of 'dummy', 'dummy2'."
+    )
@@ -60,3 +60,26 @@ def test_yaml_args() -> None:
     """
 
     assert Settings(test_attr=8989).yaml(exclude_unset=True) == "test_attr: 8989\n"
+
+
+def test_lines() -> None:
+    """
+    Check that `ConfigBase.model_dump_yaml_lines` yields each line
+    of the YAML representation of the model, without newline characters.
+    """
+
+    assert list(Settings(test_attr=8989).model_dump_yaml_lines()) == [
+        "test_attr: 8989",
+        "optional_attr: null",
+    ]
+
+
+def test_lines_args() -> None:
+    """
+    Check that arguments are passed from `ConfigBase.model_dump_yaml_lines`
+    to the `BaseModel.model_dump` method and the YAML encoder.
+    """
+
+    assert list(
+        Settings(test_attr=8989).model_dump_yaml_lines(exclude_unset=True, sort_keys=True),
+    ) == ["test_attr: 8989"]
@@ -0,0 +1,101 @@
+# Copyright (C) 2024 Callum Dickinson
+#
+# Buildarr is free software: you can redistribute it and/or modify it under the terms of the
+# GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Buildarr is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with Buildarr.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Test the `load._load_config_file` function.
+"""
+
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from buildarr.config import load_config
+from buildarr.config.load import _config_file_cache, _get_file_digest, _load_config_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    load_config.cache_clear()  # type: ignore[attr-defined]
+    yield
+    load_config.cache_clear()  # type: ignore[attr-defined]
+
+
+def test_cache_hit(tmp_path: Path) -> None:
+    """
+    Check that an unchanged file is not parsed again, and that
+    modifying the returned object does not modify the cached object.
+    """
+
+    config_file = tmp_path / "buildarr.yml"
+    config_file.write_text("buildarr:\n  update_times:\n    - '03:00'\n")
+
+    config, _ = _load_config_file(config_file)
+    config["buildarr"]["update_times"].append("04:00")
+
+    assert _load_config_file(config_file)[0] == {"buildarr": {"update_times": ["03:00"]}}
+    assert len(_config_file_cache) == 1
+
+
+def test_cache_invalidate(tmp_path: Path) -> None:
+    """
+    Check that a file is parsed again when its modification time changes.
+    """
+
+    config_file = tmp_path / "buildarr.yml"
+    config_file.write_text("test: 1\n")
+
+    assert _load_config_file(config_file)[0] == {"test": 1}
+
+    config_file.write_text("test: 2\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _load_config_file(config_file)[0] == {"test": 2}
+    assert len(_config_file_cache) == 1
+
+
+def test_cache_size(tmp_path: Path, mocker) -> None:
+    """
+    Check that the least recently used entries get evicted from the cache
+    when the maximum size is exceeded.
+    """
+
+    mocker.patch("buildarr.config.load.CONFIG_FILE_CACHE_SIZE", 2)
+
+    config_files = [tmp_path / f"buildarr{i}.yml" for i in range(3)]
+    for i, config_file in enumerate(config_files):
+        config_file.write_text(f"test: {i}\n")
+        _load_config_file(config_file)
+
+    assert list(_config_file_cache.keys()) == [str(f.resolve()) for f in config_files[1:]]
+
+
+def test_digest(tmp_path: Path) -> None:
+    """
+    Check that the returned digest is generated from the file contents that were parsed,
+    including when the parsed object is returned from the cache.
+    """
+
+    config_file = tmp_path / "buildarr.yml"
+    config_file.write_bytes(b"test: 1\n")
+
+    assert _load_config_file(config_file)[1] == _get_file_digest(b"test: 1\n")
+    assert _load_config_file(config_file)[1] == _get_file_digest(b"test: 1\n")